@@ -0,0 +1,225 @@
+"""
+Numba-accelerated kernels for EMG signal processing.
+These are the hot-loop primitives used by the EMG gesture detector. When
+numba is not installed the module falls back to equivalent vectorized
+NumPy implementations, so numba stays an optional dependency.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+if NUMBA_AVAILABLE:
+
+    @njit(cache=True, fastmath=True)
+    def rms_mav_var(signal):
+        """Compute (RMS, MAV, VAR) of a window in a single loop."""
+        n = signal.size
+        sum_squares = 0.0
+        sum_abs = 0.0
+        total = 0.0
+        for i in range(n):
+            value = signal[i]
+            sum_squares += value * value
+            sum_abs += abs(value)
+            total += value
+        mean = total / n
+        return (sum_squares / n) ** 0.5, sum_abs / n, sum_squares / n - mean * mean
+
+    @njit(cache=True, fastmath=True)
+    def window_stats(signal):
+        """Compute (RMS, MAV, VAR, min, max) of a window in a single loop."""
+        n = signal.size
+        sum_squares = 0.0
+        sum_abs = 0.0
+        total = 0.0
+        min_val = signal[0]
+        max_val = signal[0]
+        for i in range(n):
+            value = signal[i]
+            sum_squares += value * value
+            sum_abs += abs(value)
+            total += value
+            if value < min_val:
+                min_val = value
+            elif value > max_val:
+                max_val = value
+        mean = total / n
+        return ((sum_squares / n) ** 0.5, sum_abs / n,
+                sum_squares / n - mean * mean, min_val, max_val)
+
+    @njit(cache=True, fastmath=True)
+    def median3(signal, out):
+        """Median filter with kernel size 3 (zero-padded like medfilt)."""
+        n = signal.size
+        for i in range(n):
+            a = signal[i - 1] if i > 0 else 0.0
+            b = signal[i]
+            c = signal[i + 1] if i < n - 1 else 0.0
+            # Median of three via a min/max network - no branches, no sort
+            low = min(a, b)
+            high = max(a, b)
+            out[i] = max(low, min(high, c))
+        return out
+
+    @njit(cache=True, fastmath=True)
+    def moving_average(signal, window, out):
+        """Uniform moving average matching convolve mode='same' (zero-padded)."""
+        n = signal.size
+        if n == 0:
+            return out
+        # out[i] averages signal[i-left .. i+right], matching the window
+        # placement of np.convolve(..., mode='same') for odd and even sizes
+        right = (window - 1) // 2
+        left = window - 1 - right
+        inv_w = 1.0 / window
+        # Running sum: one add and one subtract per output sample instead
+        # of the O(N*window) convolution
+        running = 0.0
+        for j in range(min(right + 1, n)):
+            running += signal[j]
+        out[0] = running * inv_w
+        for i in range(1, n):
+            add_index = i + right
+            if add_index < n:
+                running += signal[add_index]
+            remove_index = i - 1 - left
+            if remove_index >= 0:
+                running -= signal[remove_index]
+            out[i] = running * inv_w
+        return out
+
+    @njit(cache=True, fastmath=True)
+    def outlier_clip(signal, num_std, out):
+        """Clip samples outside mean +/- num_std standard deviations."""
+        n = signal.size
+        total = 0.0
+        sum_squares = 0.0
+        for i in range(n):
+            value = signal[i]
+            total += value
+            sum_squares += value * value
+        mean = total / n
+        variance = sum_squares / n - mean * mean
+        std = variance ** 0.5 if variance > 0.0 else 0.0
+        low = mean - num_std * std
+        high = mean + num_std * std
+        for i in range(n):
+            value = signal[i]
+            out[i] = low if value < low else (high if value > high else value)
+        return out
+
+    def make_sos_pipeline(sos):
+        """Compile a biquad cascade specialized for a fixed SOS matrix.
+
+        The coefficients are captured in the closure, so numba freezes
+        them at compile time and LLVM schedules the direct-form-II
+        transposed recurrence as a tight register loop instead of the
+        generic coefficient dispatch in scipy's sosfilt.
+        """
+        coeffs = np.ascontiguousarray(sos, dtype=np.float64)
+        n_sections = coeffs.shape[0]
+
+        @njit(fastmath=True)
+        def pipeline(signal, zi, out):
+            for i in range(signal.size):
+                value = signal[i]
+                for s in range(n_sections):
+                    y = coeffs[s, 0] * value + zi[s, 0]
+                    zi[s, 0] = coeffs[s, 1] * value - coeffs[s, 4] * y + zi[s, 1]
+                    zi[s, 1] = coeffs[s, 2] * value - coeffs[s, 5] * y
+                    value = y
+                out[i] = value
+            return out
+
+        # Warm the specialization so the first real hop does not pay the
+        # JIT compilation cost
+        pipeline(np.zeros(2, dtype=np.float32),
+                 np.zeros((n_sections, 2), dtype=np.float32),
+                 np.empty(2, dtype=np.float32))
+        return pipeline
+
+    # Warm the kernels with dummy data at import time so the first real
+    # window does not pay the JIT compilation cost
+    _warmup = np.zeros(4, dtype=np.float32)
+    _warmup_out = np.empty(4, dtype=np.float32)
+    rms_mav_var(_warmup)
+    window_stats(_warmup)
+    median3(_warmup, _warmup_out)
+    moving_average(_warmup, 3, _warmup_out)
+    outlier_clip(_warmup, 3.0, _warmup_out)
+
+else:
+
+    def make_sos_pipeline(sos):
+        """No specialized pipeline without numba - callers use sosfilt."""
+        return None
+
+    def rms_mav_var(signal):
+        """Compute (RMS, MAV, VAR) of a window (NumPy fallback)."""
+        n = signal.size
+        sum_squares = float(np.dot(signal, signal))
+        mean = float(signal.sum()) / n
+        rms = (sum_squares / n) ** 0.5
+        mav = float(np.abs(signal).sum()) / n
+        var = sum_squares / n - mean * mean
+        return rms, mav, var
+
+    def window_stats(signal):
+        """Compute (RMS, MAV, VAR, min, max) of a window (NumPy fallback)."""
+        rms, mav, var = rms_mav_var(signal)
+        return rms, mav, var, float(signal.min()), float(signal.max())
+
+    def median3(signal, out):
+        """Median filter with kernel size 3 (NumPy fallback).
+
+        Branchless min/max network: median(a,b,c) =
+        max(min(a,b), min(max(a,b), c)), three SIMD passes per window.
+        """
+        a = signal[:-2]
+        b = signal[1:-1]
+        c = signal[2:]
+        interior = out[1:-1]
+        np.maximum(a, b, out=interior)
+        np.minimum(interior, c, out=interior)
+        np.maximum(np.minimum(a, b), interior, out=interior)
+        # Zero-padded endpoints, matching scipy.signal.medfilt
+        out[0] = max(min(signal[0], signal[1]), min(max(signal[0], signal[1]), 0.0))
+        out[-1] = max(min(signal[-1], signal[-2]), min(max(signal[-1], signal[-2]), 0.0))
+        return out
+
+    def moving_average(signal, window, out):
+        """Uniform moving average matching convolve mode='same' (NumPy fallback).
+
+        O(N) box filter via cumulative sums, with the zero-padded edge
+        handling of np.convolve.
+        """
+        n = signal.size
+        if n == 0:
+            return out
+        inv_w = 1.0 / window
+        cumulative = np.empty(n + 1, dtype=np.float64)
+        cumulative[0] = 0.0
+        np.cumsum(signal, out=cumulative[1:])
+        offset = (window - 1) // 2
+        interior = out[window - 1 - offset:n - offset]
+        np.subtract(cumulative[window:], cumulative[:-window], out=interior)
+        interior *= inv_w
+        for i in range(window - 1 - offset):
+            out[i] = cumulative[i + offset + 1] * inv_w
+        for i in range(n - offset, n):
+            out[i] = (cumulative[n] - cumulative[i + offset - window + 1]) * inv_w
+        return out
+
+    def outlier_clip(signal, num_std, out):
+        """Clip samples outside mean +/- num_std std deviations (fallback)."""
+        n = signal.size
+        mean = float(signal.sum()) / n
+        variance = float(np.dot(signal, signal)) / n - mean * mean
+        std = variance ** 0.5 if variance > 0.0 else 0.0
+        np.clip(signal, mean - num_std * std, mean + num_std * std, out=out)
+        return out
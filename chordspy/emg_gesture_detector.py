@@ -25,13 +25,18 @@ DEFAULT_COMMAND_COOLDOWN = 1.0            # Default cooldown between commands
 
 # =============================================================================
 
+import logging
+import math
 import numpy as np
-from scipy.signal import butter, filtfilt
-from collections import deque
+from scipy.signal import butter, medfilt, savgol_coeffs, savgol_filter, sosfilt, sosfilt_zi
 import time
-import threading
 from typing import Callable, Optional
 
+from chordspy._emg_kernels import (make_sos_pipeline, median3, outlier_clip,
+                                   rms_mav_var, window_stats)
+
+logger = logging.getLogger(__name__)
+
 class EMGGestureDetector:
     """
     Real-time EMG gesture detector for fist close/open cycles.
@@ -56,7 +61,8 @@ class EMGGestureDetector:
         Args:
             sampling_rate: Sampling rate in Hz
             window_size: Window size in samples for feature extraction
-            overlap: Overlap between windows in samples
+            overlap: Overlap between windows in samples; windows are
+                processed every window_size - overlap samples (the hop)
             threshold_multiplier: Multiplier for adaptive threshold calculation
             min_gesture_duration: Minimum duration for a valid gesture (seconds)
             max_gesture_duration: Maximum duration for a valid gesture (seconds)
@@ -77,169 +83,334 @@ class EMGGestureDetector:
         # Initialize filters
         self._setup_filters()
         
-        # Data buffers
-        self.raw_buffer = deque(maxlen=window_size * 2)
-        self.filtered_buffer = deque(maxlen=window_size * 2)
-        self.envelope_buffer = deque(maxlen=window_size * 2)
+        # Data buffer: preallocated ring buffer (2x window size) with a
+        # monotonically increasing write index. The most recent window is
+        # read back as a contiguous slice (or via a preallocated scratch
+        # array when it wraps), avoiding per-sample Python object churn.
+        self._buffer_length = window_size * 2
+        # Both rings and the SOS filter state live in one contiguous
+        # float32 arena (~3.2 KB at the default window), so the hot loop
+        # touches a single cache-resident region instead of scattered
+        # allocations
+        state_size = self.sos_zi.size
+        self._arena = np.zeros(self._buffer_length * 2 + state_size, dtype=np.float32)
+        self._ring_buffer = self._arena[:self._buffer_length]
+        self._filtered_ring = self._arena[self._buffer_length:2 * self._buffer_length]
+        self.sos_zi = self._arena[2 * self._buffer_length:].reshape(self.sos_zi.shape)
+        self._raw_scratch = np.empty(self._buffer_length, dtype=np.float32)
+        self._pipeline_scratch = np.empty(self._buffer_length, dtype=np.float32)
+        self._filtered_scratch = np.empty(self._buffer_length, dtype=np.float32)
+        self._one_sample = np.empty(1, dtype=np.float32)
+        self._conditioning_scratch = np.empty(window_size, dtype=np.float32)
+        self._outlier_scratch = np.empty(window_size, dtype=np.float32)
+        self._abs_scratch = np.empty(window_size, dtype=np.float32)
+        self._ma_scratch = np.empty(window_size, dtype=np.float32)
+        self._ma_cumsum = np.empty(window_size + 1, dtype=np.float64)
+        self._write_index = 0
+        self._sample_count = 0
+        self._filtered_through = 0
+
+        # Windows are processed once per hop (window stride) rather than
+        # once per sample, so gesture timing resolves to hop boundaries
+        self.hop_size = max(1, window_size - overlap)
+        self._samples_since_process = 0
         
-        # Gesture detection state
+        # Gesture detection state. Timing uses the monotonic nanosecond
+        # clock: integer compares, immune to wall-clock (NTP) jumps.
         self.baseline_rms = 0.0
         self.adaptive_threshold = 0.0
+        self._adaptive_threshold_sq = 0.0
+        self._baseline_alpha = 0.01  # per-sample EMA learning rate
+        self._one_minus_alpha = 1.0 - self._baseline_alpha
+        # Closed-form compensation for updating once per hop: N per-sample
+        # EMA steps collapse to one update with (1-alpha)^N retention
+        self._ema_retention = self._one_minus_alpha ** self.hop_size
+        self._ema_gain = 1.0 - self._ema_retention
         self.gesture_active = False
-        self.gesture_start_time = 0.0
-        self.last_gesture_time = 0.0
+        self.gesture_start_time_ns = 0
+        self.last_gesture_time_ns = 0
         self.gesture_cooldown = 0.5  # 500ms cooldown between gestures
+        self._gesture_cooldown_ns = int(self.gesture_cooldown * 1e9)
+        self._min_gesture_duration_ns = int(min_gesture_duration * 1e9)
+        self._max_gesture_duration_ns = int(max_gesture_duration * 1e9)
         
         # Statistics
         self.total_gestures = 0
         self.false_positives = 0
         
-        # Threading
+        # Detection state flag (detection itself runs synchronously in
+        # add_samples -> _process_window, on the producer's thread)
         self.running = False
-        self.detection_thread = None
         
     def _setup_filters(self):
         """Setup advanced filters for EMG signal processing."""
         nyquist = self.sampling_rate / 2.0
-        
-        # High-pass filter - remove DC and low-frequency noise
-        self.hp_b, self.hp_a = butter(4, HIGH_PASS_FREQUENCY / nyquist, btype='high')
-        
-        # Low-pass filter - remove high-frequency noise
-        self.lp_b, self.lp_a = butter(4, LOW_PASS_FREQUENCY / nyquist, btype='low')
-        
+
+        # Band-pass filter - one design covering both the DC/low-frequency
+        # rejection and the high-frequency rejection (same 4 poles per
+        # band edge as the separate high-pass + low-pass pair it replaces)
+        bp_sos = butter(4, [HIGH_PASS_FREQUENCY / nyquist, LOW_PASS_FREQUENCY / nyquist], btype='band', output='sos')
+
         # Notch filter (50 Hz) - remove power line interference
-        self.notch_b, self.notch_a = butter(4, [NOTCH_50_FREQUENCY[0] / nyquist, NOTCH_50_FREQUENCY[1] / nyquist], btype='bandstop')
-        
+        notch50_sos = butter(4, [NOTCH_50_FREQUENCY[0] / nyquist, NOTCH_50_FREQUENCY[1] / nyquist], btype='bandstop', output='sos')
+
         # Notch filter (60 Hz) - remove power line interference
-        self.notch60_b, self.notch60_a = butter(4, [NOTCH_60_FREQUENCY[0] / nyquist, NOTCH_60_FREQUENCY[1] / nyquist], btype='bandstop')
-        
+        notch60_sos = butter(4, [NOTCH_60_FREQUENCY[0] / nyquist, NOTCH_60_FREQUENCY[1] / nyquist], btype='bandstop', output='sos')
+
+        # Single second-order-sections cascade applied as one streaming
+        # pass, with persistent state carried across windows. Kept in
+        # float32 so sosfilt takes its single-precision SIMD path against
+        # the float32 ring buffer.
+        self.sos = np.vstack([bp_sos, notch50_sos, notch60_sos]).astype(np.float32, order='C')
+        self.sos_zi = np.zeros((self.sos.shape[0], 2), dtype=np.float32)
+
+        # Biquad cascade specialized for these exact coefficients (None
+        # when numba is unavailable; _filter_pending then uses sosfilt)
+        self._sos_pipeline = make_sos_pipeline(self.sos)
+
+        # Savitzky-Golay smoothing taps for the default (11, 3) design,
+        # computed once - the symmetric FIR kernel replaces the per-call
+        # least-squares solve inside savgol_filter
+        self._sg_window_length = 11
+        self._sg_polyorder = 3
+        self._sg_coeffs = savgol_coeffs(self._sg_window_length, self._sg_polyorder).astype(np.float32)
+
     def _calculate_rms(self, signal: np.ndarray) -> float:
         """Calculate RMS (Root Mean Square) of the signal."""
-        return np.sqrt(np.mean(signal ** 2))
-    
+        # BLAS dot computes the sum of squares in one SIMD pass without
+        # materializing a squared temporary
+        return math.sqrt(float(np.dot(signal, signal)) / signal.size)
+
     def _calculate_mav(self, signal: np.ndarray) -> float:
         """Calculate MAV (Mean Absolute Value) of the signal."""
-        return np.mean(np.abs(signal))
-    
+        # Absolute values land in a preallocated scratch buffer so the
+        # per-window abs never allocates
+        abs_values = np.abs(signal, out=self._abs_scratch[:signal.size])
+        return float(abs_values.sum()) / signal.size
+
     def _calculate_var(self, signal: np.ndarray) -> float:
         """Calculate VAR (Variance) of the signal."""
-        return np.var(signal)
+        n = signal.size
+        mean = float(signal.sum()) / n
+        return float(np.dot(signal, signal)) / n - mean * mean
     
     def _apply_moving_average(self, signal: np.ndarray, window_size: int = 5) -> np.ndarray:
         """Apply moving average filter to reduce noise."""
-        if len(signal) < window_size:
+        n = signal.size
+        if n < window_size:
             return signal
-        
-        # Use convolution for moving average
-        kernel = np.ones(window_size) / window_size
-        smoothed = np.convolve(signal, kernel, mode='same')
-        return smoothed
+
+        # O(N) box filter via cumulative sums instead of the O(N*w)
+        # convolution with a freshly allocated ones-kernel
+        w = window_size
+        inv_w = 1.0 / w
+        cumulative = self._ma_cumsum[:n + 1]
+        cumulative[0] = 0.0
+        np.cumsum(signal, out=cumulative[1:])
+
+        out = self._ma_scratch[:n]
+        offset = (w - 1) // 2
+
+        # Interior samples see a full window
+        interior = out[w - 1 - offset:n - offset]
+        np.subtract(cumulative[w:], cumulative[:-w], out=interior)
+        interior *= inv_w
+
+        # Edge samples see a truncated (zero-padded) window, matching
+        # np.convolve(..., mode='same')
+        for i in range(w - 1 - offset):
+            out[i] = cumulative[i + offset + 1] * inv_w
+        for i in range(n - offset, n):
+            out[i] = (cumulative[n] - cumulative[i + offset - w + 1]) * inv_w
+
+        return out
     
     def _apply_median_filter(self, signal: np.ndarray, kernel_size: int = 3) -> np.ndarray:
         """Apply median filter to remove outliers and spikes."""
-        from scipy.signal import medfilt
+        if kernel_size == 3 and signal.size <= self._conditioning_scratch.size:
+            # JIT-compiled median-of-3 kernel, much cheaper than medfilt
+            # on short windows
+            return median3(signal, self._conditioning_scratch[:signal.size])
         return medfilt(signal, kernel_size)
     
     def _apply_savitzky_golay(self, signal: np.ndarray, window_length: int = 11, polyorder: int = 3) -> np.ndarray:
         """Apply Savitzky-Golay filter for smooth signal enhancement."""
-        from scipy.signal import savgol_filter
         if len(signal) < window_length:
             return signal
-        
+
         # Ensure window_length is odd
         if window_length % 2 == 0:
             window_length += 1
-        
+
+        if window_length == self._sg_window_length and polyorder == self._sg_polyorder:
+            # Apply the precomputed FIR taps directly - an 11-tap
+            # convolution instead of savgol_filter's per-call LAPACK solve
+            return np.convolve(signal, self._sg_coeffs, mode='same')
         return savgol_filter(signal, window_length, polyorder)
     
     def _remove_outliers(self, signal: np.ndarray, threshold: float = 3.0) -> np.ndarray:
-        """Remove outliers using statistical thresholding."""
-        mean_val = np.mean(signal)
-        std_val = np.std(signal)
-        
-        # Create mask for values within threshold
-        mask = np.abs(signal - mean_val) <= threshold * std_val
-        
-        # Replace outliers with interpolated values
-        if not np.all(mask):
-            indices = np.arange(len(signal))
-            signal_clean = np.interp(indices, indices[mask], signal[mask])
-            return signal_clean
-        
-        return signal
+        """Clip outliers using statistical thresholding.
+
+        Samples beyond mean +/- threshold standard deviations are clipped
+        to the bound. The downstream feature is RMS, which is insensitive
+        to clipping vs the interpolated rebuild this used to do, and the
+        clip is a single pass into a preallocated buffer.
+        """
+        return outlier_clip(signal, threshold, self._outlier_scratch[:signal.size])
     
     def _extract_features(self, signal: np.ndarray) -> dict:
-        """Extract features from EMG signal window."""
+        """Extract features from EMG signal window with fused reductions."""
+        rms, mav, var, min_val, max_val = window_stats(signal)
         features = {
-            'rms': self._calculate_rms(signal),
-            'mav': self._calculate_mav(signal),
-            'var': self._calculate_var(signal),
-            'max': np.max(signal),
-            'min': np.min(signal),
-            'range': np.max(signal) - np.min(signal)
+            'rms': rms,
+            'mav': mav,
+            'var': var,
+            'max': max_val,
+            'min': min_val,
+            'range': max_val - min_val
         }
         return features
     
     def _update_baseline(self, rms_value: float):
-        """Update baseline RMS using exponential moving average."""
-        alpha = 0.01  # Learning rate
+        """Update the baseline RMS EMA and the derived adaptive threshold.
+
+        Runs once per hop with the closed-form equivalent of hop_size
+        per-sample EMA steps, so the smoothing time constant is expressed
+        in samples regardless of the hop length.
+        """
         if self.baseline_rms == 0.0:
             self.baseline_rms = rms_value
         else:
-            self.baseline_rms = alpha * rms_value + (1 - alpha) * self.baseline_rms
-    
-    def _update_threshold(self):
-        """Update adaptive threshold based on baseline."""
+            self.baseline_rms = (self._ema_gain * rms_value
+                                 + self._ema_retention * self.baseline_rms)
         self.adaptive_threshold = self.baseline_rms * self.threshold_multiplier
+        self._adaptive_threshold_sq = self.adaptive_threshold * self.adaptive_threshold
     
     def add_sample(self, sample: float):
         """
         Add a new EMG sample for processing.
-        
+
         Args:
             sample: Raw EMG sample value
         """
-        self.raw_buffer.append(sample)
-        
-        # Process when we have enough data
-        if len(self.raw_buffer) >= self.window_size:
-            self._process_window()
-    
+        self._one_sample[0] = sample
+        self.add_samples(self._one_sample)
+
+    def add_samples(self, samples: np.ndarray):
+        """
+        Add a batch of EMG samples for processing.
+
+        Samples are written into the ring buffer with vectorized slice
+        copies and a window is processed once per hop, amortizing the
+        filter/feature cost across the whole batch.
+
+        Args:
+            samples: 1D array of raw EMG sample values
+        """
+        samples = np.asarray(samples, dtype=np.float32).ravel()
+        offset = 0
+        total = samples.size
+        while offset < total:
+            # Write up to the next hop boundary so windows are processed
+            # at the correct stream positions
+            take = min(total - offset, self.hop_size - self._samples_since_process)
+            self._write_block(samples[offset:offset + take])
+            offset += take
+            self._samples_since_process += take
+            if self._samples_since_process >= self.hop_size:
+                self._samples_since_process = 0
+                if self._sample_count >= self.window_size:
+                    self._process_window()
+
+    def _write_block(self, block: np.ndarray):
+        """Write a contiguous block of samples into the ring buffer."""
+        n = block.size
+        position = self._write_index % self._buffer_length
+        first_part = min(n, self._buffer_length - position)
+        self._ring_buffer[position:position + first_part] = block[:first_part]
+        if first_part < n:
+            self._ring_buffer[:n - first_part] = block[first_part:]
+        self._write_index += n
+        self._sample_count = min(self._sample_count + n, self._buffer_length)
+
+    def _read_recent(self, ring: np.ndarray, count: int, scratch: np.ndarray) -> np.ndarray:
+        """Return a view of the most recent count samples from a ring buffer.
+
+        The result is always a C-contiguous float32 1-D array (a direct
+        slice of the ring, or the scratch buffer when the span wraps), so
+        downstream filter calls never trigger an implicit copy.
+        """
+        start = (self._write_index - count) % self._buffer_length
+        end = start + count
+        if end <= self._buffer_length:
+            return ring[start:end]
+
+        # The span wraps around the end of the buffer - stitch the two
+        # halves into the preallocated scratch array
+        first_part = self._buffer_length - start
+        scratch[:first_part] = ring[start:]
+        scratch[first_part:count] = ring[:end - self._buffer_length]
+        return scratch[:count]
+
+    def _filter_pending(self):
+        """Run the streaming IIR cascade over samples not yet filtered.
+
+        The cascade is causal, unlike the zero-phase filtfilt it
+        replaced: detection sees a few milliseconds of pass-band group
+        delay, but no longer depends on future samples and the overlap
+        region is never re-filtered.
+        """
+        pending = self._write_index - self._filtered_through
+        if pending <= 0:
+            return
+
+        new_samples = self._read_recent(self._ring_buffer, pending, self._raw_scratch)
+        if self._sos_pipeline is not None:
+            filtered_new = self._sos_pipeline(new_samples, self.sos_zi,
+                                              self._pipeline_scratch[:pending])
+        else:
+            filtered_new, self.sos_zi = sosfilt(self.sos, new_samples, zi=self.sos_zi)
+
+        # Mirror the filtered samples into the filtered ring at the same
+        # positions as their raw counterparts
+        position = self._filtered_through % self._buffer_length
+        first_part = min(pending, self._buffer_length - position)
+        self._filtered_ring[position:position + first_part] = filtered_new[:first_part]
+        if first_part < pending:
+            self._filtered_ring[:pending - first_part] = filtered_new[first_part:]
+        self._filtered_through = self._write_index
+
     def _process_window(self):
         """Process a window of EMG data for gesture detection."""
-        # Get the most recent window
-        window_data = np.array(list(self.raw_buffer)[-self.window_size:])
-        
-        # Apply filters
+        # Filter only the samples added since the last window - the SOS
+        # state carries the boundary conditions between hops
+        self._filter_pending()
+
+        # Get the most recent filtered window and condition it
+        window_data = self._read_recent(self._filtered_ring, self.window_size, self._filtered_scratch)
         filtered_data = self._apply_filters(window_data)
-        
-        # Calculate envelope (RMS)
-        rms_value = self._calculate_rms(filtered_data)
-        
+
+        # Calculate envelope. Detection compares in the squared domain
+        # against the squared threshold, so the sqrt is only taken for
+        # the baseline EMA and the statistics readout.
+        mean_square = float(np.dot(filtered_data, filtered_data)) / filtered_data.size
+        rms_value = math.sqrt(mean_square)
+
         # Update baseline and threshold
         self._update_baseline(rms_value)
-        self._update_threshold()
-        
+
         # Detect gesture
-        self._detect_gesture(rms_value)
+        self._detect_gesture(mean_square)
     
     def _apply_filters(self, signal: np.ndarray, noise_reduction_level: int = 3) -> np.ndarray:
-        """Apply adaptive filtering based on noise reduction level."""
+        """Apply adaptive window conditioning based on noise reduction level.
+
+        The IIR band-limiting stages run incrementally in _filter_pending;
+        this method applies only the window-level noise reduction steps.
+        """
         try:
-            # Basic filtering (always applied)
-            # Step 1: High-pass filter (remove DC and low-frequency noise)
-            filtered = filtfilt(self.hp_b, self.hp_a, signal)
-            
-            # Step 2: Notch filter (remove 50 Hz power line interference)
-            filtered = filtfilt(self.notch_b, self.notch_a, filtered)
-            
-            # Step 3: Notch filter (remove 60 Hz power line interference)
-            filtered = filtfilt(self.notch60_b, self.notch60_a, filtered)
-            
-            # Step 4: Low-pass filter (remove high-frequency noise)
-            filtered = filtfilt(self.lp_b, self.lp_a, filtered)
-            
+            filtered = signal
+
             # Adaptive filtering based on noise reduction level
             if noise_reduction_level >= 2:
                 # Light outlier removal
@@ -262,53 +433,61 @@ class EMGGestureDetector:
             
             return filtered
         except Exception as e:
-            print(f"Filter error: {e}")
+            logger.error("Filter error: %s", e)
             return signal  # Return original signal if filtering fails
     
-    def _detect_gesture(self, rms_value: float):
-        """Detect fist close/open gestures based on RMS threshold."""
-        current_time = time.time()
-        
+    def _detect_gesture(self, mean_square: float):
+        """Detect fist close/open gestures based on RMS threshold.
+
+        The comparison runs in the squared domain (mean square vs squared
+        threshold), equivalent to RMS vs threshold without the sqrt.
+        """
+        current_time_ns = time.monotonic_ns()
+        above_threshold = mean_square > self._adaptive_threshold_sq
+
         # Check for gesture start (fist close)
-        if not self.gesture_active and rms_value > self.adaptive_threshold:
+        if not self.gesture_active and above_threshold:
             # Check cooldown period
-            if current_time - self.last_gesture_time > self.gesture_cooldown:
+            if current_time_ns - self.last_gesture_time_ns > self._gesture_cooldown_ns:
                 self.gesture_active = True
-                self.gesture_start_time = current_time
-                print(f"Fist close detected - RMS: {rms_value:.2f}, Threshold: {self.adaptive_threshold:.2f}")
-        
+                self.gesture_start_time_ns = current_time_ns
+                logger.debug("Fist close detected - RMS: %.2f, Threshold: %.2f",
+                             math.sqrt(mean_square), self.adaptive_threshold)
+
         # Check for gesture end (fist open)
-        elif self.gesture_active and rms_value < self.adaptive_threshold:
-            gesture_duration = current_time - self.gesture_start_time
-            
+        elif self.gesture_active and not above_threshold:
+            gesture_duration_ns = current_time_ns - self.gesture_start_time_ns
+
             # Validate gesture duration
-            if self.min_gesture_duration <= gesture_duration <= self.max_gesture_duration:
-                self._complete_gesture()
+            if self._min_gesture_duration_ns <= gesture_duration_ns <= self._max_gesture_duration_ns:
+                self._complete_gesture(current_time_ns)
             else:
-                print(f"Invalid gesture duration: {gesture_duration:.3f}s")
+                logger.debug("Invalid gesture duration: %.3fs", gesture_duration_ns / 1e9)
                 self.false_positives += 1
-            
+
             self.gesture_active = False
-        
+
         # Check for maximum gesture duration
-        elif self.gesture_active and current_time - self.gesture_start_time > self.max_gesture_duration:
-            print("Gesture timeout - maximum duration exceeded")
+        elif self.gesture_active and current_time_ns - self.gesture_start_time_ns > self._max_gesture_duration_ns:
+            logger.debug("Gesture timeout - maximum duration exceeded")
             self.gesture_active = False
             self.false_positives += 1
-    
-    def _complete_gesture(self):
+
+    def _complete_gesture(self, current_time_ns: int):
         """Complete a detected gesture and trigger callback."""
         self.total_gestures += 1
-        self.last_gesture_time = time.time()
-        
-        print(f"✅ Gesture completed! Total gestures: {self.total_gestures}")
+        # Reuse the clock sample taken in _detect_gesture so the gesture
+        # end and the cooldown reference are the same instant
+        self.last_gesture_time_ns = current_time_ns
         
+        logger.info("Gesture completed! Total gestures: %d", self.total_gestures)
+
         # Call the gesture callback if provided
         if self.gesture_callback:
             try:
                 self.gesture_callback()
             except Exception as e:
-                print(f"Error in gesture callback: {e}")
+                logger.error("Error in gesture callback: %s", e)
     
     def get_statistics(self) -> dict:
         """Get detection statistics."""
@@ -326,31 +505,28 @@ class EMGGestureDetector:
         self.false_positives = 0
         self.baseline_rms = 0.0
         self.adaptive_threshold = 0.0
-    
+        self._adaptive_threshold_sq = 0.0
+
     def set_threshold_multiplier(self, multiplier: float):
         """Set the threshold multiplier for gesture detection."""
         self.threshold_multiplier = multiplier
-        self._update_threshold()
+        self.adaptive_threshold = self.baseline_rms * multiplier
+        self._adaptive_threshold_sq = self.adaptive_threshold * self.adaptive_threshold
     
     def start_detection(self):
-        """Start the gesture detection thread."""
+        """Start gesture detection.
+
+        Detection work happens inline as samples arrive, so this only
+        arms the detector - no helper thread is spawned.
+        """
         if not self.running:
             self.running = True
-            self.detection_thread = threading.Thread(target=self._detection_loop, daemon=True)
-            self.detection_thread.start()
-            print("EMG gesture detection started")
-    
+            logger.info("EMG gesture detection started")
+
     def stop_detection(self):
-        """Stop the gesture detection thread."""
+        """Stop gesture detection."""
         self.running = False
-        if self.detection_thread:
-            self.detection_thread.join(timeout=1.0)
-        print("EMG gesture detection stopped")
-    
-    def _detection_loop(self):
-        """Main detection loop (runs in separate thread)."""
-        while self.running:
-            time.sleep(0.001)  # 1ms sleep to prevent busy waiting
+        logger.info("EMG gesture detection stopped")
 
 
 class GrabReleaseController:
@@ -373,42 +549,42 @@ class GrabReleaseController:
         self.state = "idle"  # idle, grab, release
         self.fist_cycle_count = 0
         self.command_callback = command_callback
-        self.last_command_time = 0.0
+        self.last_command_time_ns = 0
         self.command_cooldown = DEFAULT_COMMAND_COOLDOWN
-        
+
     def process_gesture(self):
         """
         Process a detected fist close/open cycle.
         Alternates between grab and release commands.
         """
-        current_time = time.time()
-        
+        current_time_ns = time.monotonic_ns()
+
         # Check cooldown period
-        if current_time - self.last_command_time < self.command_cooldown:
-            print(f"Command cooldown active: {self.command_cooldown - (current_time - self.last_command_time):.1f}s remaining")
+        elapsed_ns = current_time_ns - self.last_command_time_ns
+        cooldown_ns = int(self.command_cooldown * 1e9)
+        if elapsed_ns < cooldown_ns:
+            logger.debug("Command cooldown active: %.1fs remaining",
+                         (cooldown_ns - elapsed_ns) / 1e9)
             return
         
         self.fist_cycle_count += 1
-        
-        if self.fist_cycle_count % 2 == 1:
-            # Odd count: GRAB operation
-            self.state = "grab"
-            self._send_command("grab")
-        else:
-            # Even count: RELEASE operation  
-            self.state = "release"
-            self._send_command("release")
+
+        # Odd cycles grab, even cycles release - a lookup on the low bit
+        # instead of a modulo branch
+        command = ("release", "grab")[self.fist_cycle_count & 1]
+        self.state = command
+        self._send_command(command)
     
     def _send_command(self, command: str):
         """Send a command to the robotic arm."""
-        self.last_command_time = time.time()
-        print(f"🤖 Robotic Arm Command: {command.upper()}")
-        
+        self.last_command_time_ns = time.monotonic_ns()
+        logger.info("Robotic Arm Command: %s", command.upper())
+
         if self.command_callback:
             try:
                 self.command_callback(command)
             except Exception as e:
-                print(f"Error in command callback: {e}")
+                logger.error("Error in command callback: %s", e)
     
     def get_state(self) -> dict:
         """Get current controller state."""
@@ -422,7 +598,7 @@ class GrabReleaseController:
         """Reset the controller state."""
         self.state = "idle"
         self.fist_cycle_count = 0
-        self.last_command_time = 0.0
+        self.last_command_time_ns = 0
 
 
 def test_gesture_detector():
@@ -438,20 +614,20 @@ def test_gesture_detector():
         gesture_callback=controller.process_gesture
     )
     
-    # Simulate EMG data
+    # Simulate EMG data: fist close (high amplitude) during three bursts,
+    # fist open (low amplitude) elsewhere - generated in one vectorized
+    # draw and fed through the batch entry point
     print("Simulating EMG data...")
-    for i in range(1000):
-        # Simulate fist close/open cycles
-        if 100 <= i <= 200 or 400 <= i <= 500 or 700 <= i <= 800:
-            # Fist close: high amplitude
-            sample = np.random.normal(500, 100)
-        else:
-            # Fist open: low amplitude
-            sample = np.random.normal(50, 20)
-        
-        detector.add_sample(sample)
-        time.sleep(0.001)  # 1ms delay
-    
+    rng = np.random.default_rng()
+    indices = np.arange(1000)
+    fist_closed = (((100 <= indices) & (indices <= 200))
+                   | ((400 <= indices) & (indices <= 500))
+                   | ((700 <= indices) & (indices <= 800)))
+    loc = np.where(fist_closed, 500.0, 50.0)
+    scale = np.where(fist_closed, 100.0, 20.0)
+    detector.add_samples(rng.normal(loc, scale))
+
+
     # Print statistics
     stats = detector.get_statistics()
     print(f"\nDetection Statistics:")
@@ -8,6 +8,9 @@ It provides a complete system for controlling a robotic arm using EMG signals.
 # GLOBAL CONFIGURATION VARIABLES
 # =============================================================================
 
+# Data Acquisition Configuration
+LSL_CHUNK_SAMPLES = 64                    # Max samples pulled per LSL chunk (~64 ms at 1 kHz)
+
 # Signal Processing Configuration
 ENABLE_ADVANCED_FILTERING = True          # Enable/disable advanced filtering
 DEFAULT_NOISE_REDUCTION_LEVEL = 2         # Default noise reduction (1-5)
@@ -16,6 +19,7 @@ DEFAULT_MIN_GESTURE_DURATION = 50         # Minimum gesture duration in ms
 DEFAULT_MAX_GESTURE_DURATION = 2000       # Maximum gesture duration in ms
 
 # Visualization Configuration
+VISUALIZATION_BUFFER_SIZE = 1024          # Ring buffer length (power of two)
 VISUALIZATION_UPDATE_RATE = 50            # Visualization update rate in ms (20 FPS)
 ENABLE_VISUALIZATION_SMOOTHING = True     # Enable smoothing for visualization
 VISUALIZATION_SMOOTHING_WINDOW = 3        # Window size for visualization smoothing
@@ -48,6 +52,8 @@ NOTCH_60_FREQUENCY = [59.0, 61.0]         # 60 Hz notch filter range
 
 # =============================================================================
 
+import math
+from collections import deque
 import numpy as np
 import pylsl
 import time
@@ -61,44 +67,68 @@ from PyQt5.QtCore import QTimer, pyqtSignal, QThread
 from PyQt5.QtGui import QFont, QPalette, QColor
 import pyqtgraph as pg
 
+from chordspy._emg_kernels import moving_average
 from chordspy.emg_gesture_detector import EMGGestureDetector, GrabReleaseController
 from chordspy.robotic_arm_controller import RoboticArmController
 
 
 class EMGDataThread(QThread):
     """Thread for processing EMG data from LSL stream."""
-    
-    data_received = pyqtSignal(list)  # Signal emitted when new data is received
-    
+
     def __init__(self):
         super().__init__()
         self.running = False
         self.inlet = None
         self.sampling_rate = 1000
+        # Per-chunk consumer invoked on this thread - all numeric work
+        # (ring writes, gesture detection) happens here so the 1 kHz
+        # stream never crosses the Qt event loop
+        self.processor = None
         
     def run(self):
         """Main thread loop for processing EMG data."""
-        # Find LSL stream
-        streams = pylsl.resolve_stream('type', 'EXG')
+        self.running = True
+
+        # Find LSL stream. resolve_byprop with a timeout keeps the
+        # resolve phase interruptible via stop(), unlike resolve_stream
+        # which blocks indefinitely when no stream exists
+        streams = []
+        while self.running and not streams:
+            streams = pylsl.resolve_byprop('type', 'EXG', timeout=2.0)
         if not streams:
             print("❌ No EMG stream found!")
             return
         
-        # Connect to stream
-        self.inlet = pylsl.StreamInlet(streams[0])
-        self.sampling_rate = int(self.inlet.info().nominal_srate())
+        # Connect to stream. max_buflen caps liblsl's internal buffer at
+        # one second (the default is minutes, so a brief GUI stall would
+        # otherwise queue unbounded backlog and latency); max_chunklen
+        # matches the pull size.
+        self.inlet = pylsl.StreamInlet(streams[0], max_buflen=1,
+                                       max_chunklen=LSL_CHUNK_SAMPLES,
+                                       recover=True)
+        info = self.inlet.info()
+        self.sampling_rate = int(info.nominal_srate())
+        n_channels = info.channel_count()
         print(f"📡 Connected to EMG stream at {self.sampling_rate} Hz")
-        
-        self.running = True
+
+        # Preallocated chunk buffer: liblsl writes samples directly into
+        # it via dest_obj, so pulling a chunk creates no Python objects
+        self._chunk_buf = np.empty((LSL_CHUNK_SAMPLES, n_channels), dtype=np.float32)
+
         while self.running:
             try:
-                # Pull data from LSL stream
-                samples, _ = self.inlet.pull_chunk(timeout=0.1, max_samples=10)
-                if samples:
-                    # Emit the first channel data
-                    for sample in samples:
-                        if len(sample) > 0:
-                            self.data_received.emit([sample[0]])
+                # Pull data from LSL straight into the preallocated buffer
+                _, timestamps = self.inlet.pull_chunk(
+                    timeout=0.1, max_samples=LSL_CHUNK_SAMPLES,
+                    dest_obj=self._chunk_buf)
+                n = len(timestamps)
+                if n:
+                    # Process the first channel of the chunk in-thread;
+                    # the buffer is not reused until this returns, so no
+                    # copy is needed
+                    processor = self.processor
+                    if processor is not None:
+                        processor(self._chunk_buf[:n, 0])
             except Exception as e:
                 print(f"Error in EMG data thread: {e}")
                 break
@@ -122,15 +152,63 @@ class EMGRoboticArmApp(QMainWindow):
         self.gesture_detector = None
         self.grab_release_controller = None
         self.robotic_arm = None
-        
-        # Data buffers for visualization
-        self.emg_buffer = np.zeros(1000)
-        self.envelope_buffer = np.zeros(1000)
-        self.current_index = 0
+        # Connection flag maintained by the connect/disconnect paths so
+        # the per-gesture command path never probes the controller
+        self._arm_connected = False
+        
+        # Data buffers for visualization. Each ring is mirrored into a
+        # double-length backing store so the time-ordered history
+        # (oldest -> newest) is always a single contiguous view - the
+        # old modulo-indexed buffer plotted the wrap point mid-window.
+        self._visualization_buffer_size = VISUALIZATION_BUFFER_SIZE
+        # Power-of-two length, so wrapping a write head is a bitwise AND
+        # rather than a modulo
+        self._buffer_mask = VISUALIZATION_BUFFER_SIZE - 1
+        # float32 end-to-end: LSL delivers float32, so float64 buffers
+        # would silently upcast every write and halve SIMD width in the
+        # smoothing/RMS chain
+        self._emg_backing = np.zeros(2 * self._visualization_buffer_size, dtype=np.float32)
+        self._envelope_backing = np.zeros(2 * self._visualization_buffer_size, dtype=np.float32)
+        self._w = 0       # EMG ring write head
+        self._env_w = 0   # envelope ring write head
+
+        # Preallocated destination for visualization smoothing
+        self._smooth_out = np.empty(self._visualization_buffer_size, dtype=np.float32)
+
+        # The acquisition thread writes the EMG ring; the GUI timer
+        # snapshots it under this lock before painting
+        self._data_lock = threading.Lock()
+        self._emg_snapshot = np.zeros(self._visualization_buffer_size, dtype=np.float32)
+
+        # Constant plot x-axis, built once and shared by both curves
+        self._x = np.linspace(0, 1, self._visualization_buffer_size, dtype=np.float32)
+
+        # Threshold line state - only pushed to the plot when the value
+        # actually changes
+        self._last_threshold = None
+
+        # Write head as of the last painted frame, to skip frames with
+        # no new samples
+        self._last_plotted_w = -1
+
+        # Last rendered statistics values - setText forces a relayout
+        # even for identical text, so labels update only on change
+        self._last_detector_stats = None
+        self._last_command_count = None
+        self._last_controller_state = None
         
         # Statistics
         self.total_gestures = 0
         self.total_commands = 0
+
+        # Pending log lines, flushed to the text widget in batches so a
+        # burst of messages costs one Qt reflow instead of one per line.
+        # The deque append is also safe to call from the acquisition
+        # thread, unlike touching the QTextEdit directly.
+        self._pending_logs = deque(maxlen=1000)
+        # strftime cache - the stamp only changes once per second
+        self._last_log_second = 0
+        self._last_log_stamp = ''
         
         # Setup UI
         self.setup_ui()
@@ -276,6 +354,9 @@ class EMGRoboticArmApp(QMainWindow):
         self.log_text = QTextEdit()
         self.log_text.setMaximumHeight(150)
         self.log_text.setReadOnly(True)
+        # Let the document trim old lines itself instead of re-setting
+        # the full text on every append
+        self.log_text.document().setMaximumBlockCount(LOG_MAX_LINES)
         log_layout.addWidget(self.log_text)
         
         layout.addWidget(log_group)
@@ -304,7 +385,23 @@ class EMGRoboticArmApp(QMainWindow):
         # Plot curves
         self.emg_curve = self.emg_plot.plot(pen=pg.mkPen('b', width=1))
         self.envelope_curve = self.envelope_plot.plot(pen=pg.mkPen('r', width=2))
-        self.threshold_line = self.envelope_plot.plot(pen=pg.mkPen('g', width=2, style=pg.QtCore.Qt.DashLine))
+        # The threshold is a horizontal line item - repositioning it is a
+        # setPos, not a curve re-upload
+        self.threshold_line = pg.InfiniteLine(
+            angle=0, pen=pg.mkPen('g', width=2, style=pg.QtCore.Qt.DashLine))
+        self.threshold_line.hide()
+        self.envelope_plot.addItem(self.threshold_line)
+
+        # Let pyqtgraph decimate curves to screen resolution with
+        # min/max (peak) downsampling and skip offscreen points - the
+        # full buffers carry far more points than there are pixels
+        for plot in (self.emg_plot, self.envelope_plot):
+            plot.setDownsampling(auto=True, mode='peak')
+            plot.setClipToView(True)
+            # Continuous auto-ranging recomputes the data bounds on
+            # every setData; ranges are refit on a slow timer instead
+            plot.setXRange(0, 1, padding=0)
+            plot.disableAutoRange()
         
         layout.addWidget(self.emg_plot)
         layout.addWidget(self.envelope_plot)
@@ -320,8 +417,9 @@ class EMGRoboticArmApp(QMainWindow):
         self.stop_btn.clicked.connect(self.stop_control)
         self.emergency_btn.clicked.connect(self.emergency_stop)
         
-        # EMG data thread connection
-        self.emg_thread.data_received.connect(self.process_emg_data)
+        # EMG data is processed on the acquisition thread itself; the
+        # GUI timers below only read the results
+        self.emg_thread.processor = self.process_emg_data
         
         # Settings connections
         self.threshold_spinbox.valueChanged.connect(self.update_gesture_settings)
@@ -339,6 +437,17 @@ class EMGRoboticArmApp(QMainWindow):
         self.stats_timer = QTimer()
         self.stats_timer.timeout.connect(self.update_statistics)
         self.stats_timer.start(STATS_UPDATE_INTERVAL)
+
+        # Log flush timer - drains the pending-log deque in one append
+        self.log_timer = QTimer()
+        self.log_timer.timeout.connect(self._flush_log)
+        self.log_timer.start(200)
+
+        # Slow range-refit timer - one-shot autoRange well below the
+        # frame rate, instead of continuous auto-ranging per setData
+        self.range_timer = QTimer()
+        self.range_timer.timeout.connect(self._refit_plot_ranges)
+        self.range_timer.start(2000)
     
     def initialize_components(self):
         """Initialize the gesture detector and robotic arm controller."""
@@ -371,7 +480,8 @@ class EMGRoboticArmApp(QMainWindow):
             # Clear the plots
             self.emg_curve.setData([], [])
             self.envelope_curve.setData([], [])
-            self.threshold_line.setData([], [])
+            self.threshold_line.hide()
+            self._last_threshold = None
             self.visualization_status_label.setText("Visualization: ❌ Stopped")
             self.log_message("📊 Stopped real-time visualization")
     
@@ -489,6 +599,7 @@ class EMGRoboticArmApp(QMainWindow):
             self.robotic_arm = RoboticArmController(mock_mode=mock_mode)
             
             if self.robotic_arm.connect():
+                self._arm_connected = True
                 self.arm_status_label.setText("Robotic Arm: ✅ Connected")
                 self.arm_toggle_btn.setText("Disconnect Robotic Arm")
                 self.arm_toggle_btn.setStyleSheet("QPushButton { background-color: orange; color: white; }")
@@ -531,6 +642,7 @@ class EMGRoboticArmApp(QMainWindow):
             # Disconnect the arm
             if self.robotic_arm:
                 self.robotic_arm.disconnect()
+                self._arm_connected = False
                 self.log_message("🤖 Disconnected from robotic arm")
             
             # Update UI
@@ -564,6 +676,7 @@ class EMGRoboticArmApp(QMainWindow):
             # Disconnect the arm
             if self.robotic_arm:
                 self.robotic_arm.disconnect()
+                self._arm_connected = False
                 self.log_message("🤖 Emergency disconnected from robotic arm")
             
             # Update UI
@@ -659,24 +772,47 @@ class EMGRoboticArmApp(QMainWindow):
             noise_reduction = self.noise_reduction_spinbox.value()
             self.log_message(f"🔧 Signal processing: Advanced={advanced_filtering}, Noise reduction={noise_reduction}")
     
+    @property
+    def emg_buffer(self):
+        """Time-ordered (oldest -> newest) contiguous view of the EMG history."""
+        return self._emg_backing[self._w:self._w + self._visualization_buffer_size]
+
+    @property
+    def envelope_buffer(self):
+        """Time-ordered (oldest -> newest) contiguous view of the envelope history."""
+        return self._envelope_backing[self._env_w:self._env_w + self._visualization_buffer_size]
+
     def process_emg_data(self, data):
-        """Process incoming EMG data."""
-        if not data:
+        """Process an incoming chunk of EMG samples.
+
+        Runs on the acquisition thread, not the GUI thread - only the
+        ring write is taken under the data lock.
+        """
+        n = data.size
+        if n == 0:
             return
-        
-        sample = data[0]
-        
-        # Add to visualization buffer
-        self.emg_buffer[self.current_index] = sample
-        self.current_index = (self.current_index + 1) % len(self.emg_buffer)
-        
-        # Process with gesture detector
+
+        # Write the chunk into both halves of the mirrored backing store
+        # with slice copies, splitting at the wrap point
+        size = self._visualization_buffer_size
+        with self._data_lock:
+            index = self._w
+            first_part = min(n, size - index)
+            self._emg_backing[index:index + first_part] = data[:first_part]
+            self._emg_backing[index + size:index + size + first_part] = data[:first_part]
+            if first_part < n:
+                remainder = n - first_part
+                self._emg_backing[:remainder] = data[first_part:]
+                self._emg_backing[size:size + remainder] = data[first_part:]
+            self._w = (index + n) & self._buffer_mask
+
+        # Process the whole chunk with the gesture detector in one call
         if self.gesture_detector:
-            self.gesture_detector.add_sample(sample)
+            self.gesture_detector.add_samples(data)
     
     def send_arm_command(self, command):
         """Send command to robotic arm."""
-        if self.robotic_arm and self.robotic_arm.is_connected():
+        if self._arm_connected:
             if command == 'grab':
                 self.robotic_arm.grab_object()
                 self.total_commands += 1
@@ -688,71 +824,124 @@ class EMGRoboticArmApp(QMainWindow):
     
     def update_visualization(self):
         """Update the visualization plots with enhanced signal processing."""
-        # Always update EMG plot if we have data
-        time_data = np.linspace(0, 1, len(self.emg_buffer))
-        
+        # Skip the frame entirely when the window is hidden or no new
+        # samples arrived since the last paint
+        if not self.isVisible() or self._w == self._last_plotted_w:
+            return
+
+        # Snapshot the ring under the lock so the acquisition thread can
+        # keep writing while we paint
+        with self._data_lock:
+            np.copyto(self._emg_snapshot, self.emg_buffer)
+            self._last_plotted_w = self._w
+
         # Apply basic smoothing for visualization
-        if len(self.emg_buffer) > 0:
+        if len(self._emg_snapshot) > 0:
             # Apply moving average for smoother visualization
-            smoothed_buffer = self._apply_visualization_smoothing(self.emg_buffer)
-            self.emg_curve.setData(time_data, smoothed_buffer)
-        
+            smoothed_buffer = self._apply_visualization_smoothing(self._emg_snapshot)
+            # skipFiniteCheck avoids the per-point NaN scan; the buffers
+            # only ever hold finite samples
+            self.emg_curve.setData(self._x, smoothed_buffer,
+                                   skipFiniteCheck=True)
+
         # Update envelope plot with improved RMS calculation
-        recent_data = self.emg_buffer[-100:]  # Last 100 samples
+        recent_data = self._emg_snapshot[-100:]  # Last 100 samples
         if len(recent_data) > 0:
             # Apply smoothing to recent data for better envelope
-            smoothed_recent = self._apply_visualization_smoothing(recent_data)
-            rms_value = np.sqrt(np.mean(smoothed_recent ** 2))
-            self.envelope_buffer[self.current_index] = rms_value
-            
-            envelope_time = np.linspace(0, 1, len(self.envelope_buffer))
-            self.envelope_curve.setData(envelope_time, self.envelope_buffer)
+            # Fused RMS: a BLAS dot gives the sum of squares in one pass
+            # with no squared temporary, straight off the raw window -
+            # the box-filter pre-pass barely moved the window mean and
+            # cost an extra smoothing run per frame
+            rms_value = math.sqrt(float(np.dot(recent_data, recent_data)) / recent_data.size)
+            size = self._visualization_buffer_size
+            self._envelope_backing[self._env_w] = rms_value
+            self._envelope_backing[self._env_w + size] = rms_value
+            self._env_w = (self._env_w + 1) & self._buffer_mask
+
+            self.envelope_curve.setData(self._x, self.envelope_buffer,
+                                        skipFiniteCheck=True)
             
-            # Update threshold line if gesture detector is available
+            # Update threshold line only when the value changed - the
+            # detector's threshold is read as a plain attribute, keeping
+            # the dict-building get_statistics out of the render path
             if self.gesture_detector:
-                stats = self.gesture_detector.get_statistics()
-                threshold_value = stats.get('adaptive_threshold', 0)
-                self.threshold_line.setData([0, 1], [threshold_value, threshold_value])
+                threshold_value = self.gesture_detector.adaptive_threshold
             else:
-                # Show a default threshold line based on smoothed data
-                default_threshold = np.mean(smoothed_recent) * 2
-                self.threshold_line.setData([0, 1], [default_threshold, default_threshold])
-    
+                # Show a default threshold line based on recent data
+                threshold_value = float(np.mean(recent_data)) * 2
+            if threshold_value != self._last_threshold:
+                self._last_threshold = threshold_value
+                self.threshold_line.setPos(threshold_value)
+                if not self.threshold_line.isVisible():
+                    self.threshold_line.show()
+    
+    def _refit_plot_ranges(self):
+        """Refit the plot ranges outside the per-frame path."""
+        if not self.update_timer.isActive():
+            return
+        self.emg_plot.getViewBox().autoRange()
+        self.envelope_plot.getViewBox().autoRange()
+
     def _apply_visualization_smoothing(self, signal: np.ndarray) -> np.ndarray:
         """Apply smoothing for visualization purposes."""
         if not ENABLE_VISUALIZATION_SMOOTHING or len(signal) < VISUALIZATION_SMOOTHING_WINDOW:
             return signal
-        
-        # Simple moving average for visualization
-        kernel = np.ones(VISUALIZATION_SMOOTHING_WINDOW) / VISUALIZATION_SMOOTHING_WINDOW
-        smoothed = np.convolve(signal, kernel, mode='same')
-        return smoothed
+
+        # O(N) running-sum moving average into a preallocated buffer
+        # (JIT-compiled when numba is available) instead of the
+        # O(N*window) convolution with a freshly built kernel
+        return moving_average(signal, VISUALIZATION_SMOOTHING_WINDOW,
+                              self._smooth_out[:signal.size])
     
     def update_statistics(self):
         """Update the statistics display."""
-        if self.gesture_detector:
-            stats = self.gesture_detector.get_statistics()
-            self.gesture_count_label.setText(f"Gestures Detected: {stats['total_gestures']}")
-            self.baseline_label.setText(f"Baseline RMS: {stats['baseline_rms']:.2f}")
-            self.threshold_label.setText(f"Current Threshold: {stats['adaptive_threshold']:.2f}")
-        
-        self.command_count_label.setText(f"Commands Sent: {self.total_commands}")
-        
-        if self.grab_release_controller:
-            state = self.grab_release_controller.get_state()
-            self.current_state_label.setText(f"State: {state['state'].upper()}")
-            self.next_action_label.setText(f"Next Action: {state['next_action'].upper()}")
-            self.cycle_count_label.setText(f"Fist Cycles: {state['fist_cycle_count']}")
+        # Read scalar attributes directly; get_statistics/get_state
+        # build a throwaway dict per call and stay for external callers
+        detector = self.gesture_detector
+        if detector:
+            stats = (detector.total_gestures, detector.baseline_rms,
+                     detector.adaptive_threshold)
+            if stats != self._last_detector_stats:
+                self._last_detector_stats = stats
+                self.gesture_count_label.setText(f"Gestures Detected: {stats[0]}")
+                self.baseline_label.setText(f"Baseline RMS: {stats[1]:.2f}")
+                self.threshold_label.setText(f"Current Threshold: {stats[2]:.2f}")
+
+        if self.total_commands != self._last_command_count:
+            self._last_command_count = self.total_commands
+            self.command_count_label.setText(f"Commands Sent: {self.total_commands}")
+
+        controller = self.grab_release_controller
+        if controller:
+            state = (controller.state, controller.fist_cycle_count)
+            if state != self._last_controller_state:
+                self._last_controller_state = state
+                next_action = ("release", "grab")[(state[1] + 1) & 1]
+                self.current_state_label.setText(f"State: {state[0].upper()}")
+                self.next_action_label.setText(f"Next Action: {next_action.upper()}")
+                self.cycle_count_label.setText(f"Fist Cycles: {state[1]}")
     
     def log_message(self, message):
-        """Add a message to the log."""
-        timestamp = time.strftime("%H:%M:%S")
-        self.log_text.append(f"[{timestamp}] {message}")
-        
-        # Keep only last LOG_MAX_LINES lines
-        lines = self.log_text.toPlainText().split('\n')
-        if len(lines) > LOG_MAX_LINES:
-            self.log_text.setPlainText('\n'.join(lines[-LOG_MAX_LINES:]))
+        """Queue a message for the log display."""
+        now = int(time.time())
+        if now != self._last_log_second:
+            self._last_log_second = now
+            self._last_log_stamp = time.strftime("%H:%M:%S", time.localtime(now))
+        self._pending_logs.append(f"[{self._last_log_stamp}] {message}")
+
+    def _flush_log(self):
+        """Flush queued log messages to the text widget in one append."""
+        if not self._pending_logs:
+            return
+        # Drain with popleft so lines appended by the acquisition thread
+        # mid-flush are kept for the next tick instead of being cleared
+        lines = []
+        while True:
+            try:
+                lines.append(self._pending_logs.popleft())
+            except IndexError:
+                break
+        self.log_text.append('\n'.join(lines))
     
     def closeEvent(self, event):
         """Handle application close event."""
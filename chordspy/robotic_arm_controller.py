@@ -4,12 +4,44 @@ This module provides communication interface for SAZ DEKOR robotic arm integrati
 It handles serial communication and command formatting for the robotic arm.
 """
 
+import os
+import queue
+import logging
+import re
 import serial
+import serial.tools.list_ports
 import time
 import threading
 from typing import Optional, Dict, Any
 import json
 
+logger = logging.getLogger(__name__)
+
+# Port descriptors that look like a USB serial adapter
+_ARM_PORT_RE = re.compile(r'USB|ACM|ttyUSB|ttyACM')
+
+
+class _ArmPose:
+    """Fixed-layout arm pose record - one slot per joint.
+
+    Attribute access on a __slots__ instance is a fixed-offset load,
+    cheaper than the dict lookups and per-status dict copies the pose
+    used to cost.
+    """
+    __slots__ = ('base', 'shoulder', 'elbow', 'wrist', 'gripper')
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        """Return every joint to its home angle."""
+        self.base = 90      # Base rotation (0-180)
+        self.shoulder = 90  # Shoulder joint (0-180)
+        self.elbow = 90     # Elbow joint (0-180)
+        self.wrist = 90     # Wrist joint (0-180)
+        self.gripper = 0    # Gripper state (0=open, 1=closed)
+
+
 class RoboticArmController:
     """
     Controller for SAZ DEKOR® DIY 6-DOF Robot Mechanical Arm Kits.
@@ -21,7 +53,27 @@ class RoboticArmController:
     - Safety features
     """
     
-    def __init__(self, 
+    # Pre-encoded wire commands so the worker thread never formats or
+    # encodes strings on the send path
+    _CMD_GRAB = b"GRAB\n"
+    _CMD_RELEASE = b"RELEASE\n"
+    _CMD_HOME = b"HOME\n"
+    _CMD_STATUS = b"STATUS\n"
+    _CMD_EMERGENCY_STOP = b"EMERGENCY_STOP\n"
+    _MOVE_PREFIX = {
+        'base': b"MOVE_BASE_",
+        'shoulder': b"MOVE_SHOULDER_",
+        'elbow': b"MOVE_ELBOW_",
+        'wrist': b"MOVE_WRIST_",
+        'gripper': b"MOVE_GRIPPER_",
+    }
+    _ANGLE_BYTES = tuple(b"%d\n" % i for i in range(181))
+    _JOINT_NAMES = _ArmPose.__slots__
+    # Hash/range lookups for hot-path validation in move_joint
+    _JOINT_SET = frozenset(_JOINT_NAMES)
+    _ANGLE_RANGE = range(181)
+
+    def __init__(self,
                  port: Optional[str] = None,
                  baudrate: int = 9600,
                  timeout: float = 1.0,
@@ -45,19 +97,27 @@ class RoboticArmController:
         self.serial_connection = None
         
         # Arm state
-        self.current_position = {
-            'base': 90,      # Base rotation (0-180)
-            'shoulder': 90,  # Shoulder joint (0-180)
-            'elbow': 90,     # Elbow joint (0-180)
-            'wrist': 90,     # Wrist joint (0-180)
-            'gripper': 0     # Gripper state (0=open, 1=closed)
-        }
+        self.pose = _ArmPose()
+        # Position payload reused across get_status calls - refreshed
+        # only after a command has run, not on every poll
+        self._position_cache = {name: getattr(self.pose, name)
+                                for name in self._JOINT_NAMES}
+        self._pose_dirty = False
         
-        # Command queue and threading
-        self.command_queue = []
-        self.command_lock = threading.Lock()
+        # Command queue and threading - a blocking queue wakes the worker
+        # the moment a command arrives instead of polling every 10 ms
+        self.command_queue = queue.Queue()
         self.command_thread = None
-        self.running = False
+        self._stop = threading.Event()
+
+        # Move coalescing: the latest queued move per joint, so a burst
+        # of setpoints retargets the queued command in place instead of
+        # making the arm chase every intermediate angle. Gripper repeats
+        # are debounced instead (alternating grab/release always passes).
+        self._pending_moves: Dict[str, Dict[str, Any]] = {}
+        self._pending_lock = threading.Lock()
+        self._last_gripper_cmd = (None, 0.0)
+        self._gripper_debounce = 0.05  # seconds
         
         # Safety parameters
         self.max_speed = 50  # Maximum servo speed
@@ -67,6 +127,17 @@ class RoboticArmController:
         self.commands_sent = 0
         self.commands_failed = 0
         self.last_command_time = 0.0
+
+        # Status payload reused across get_status polls; only the fields
+        # that change get rewritten
+        self._status_payload = {
+            'connected': False,
+            'position': self._position_cache,
+            'commands_sent': 0,
+            'commands_failed': 0,
+            'queue_size': 0,
+            'last_command_time': 0.0,
+        }
         
     def connect(self) -> bool:
         """
@@ -76,16 +147,17 @@ class RoboticArmController:
             bool: True if connection successful, False otherwise
         """
         if self.mock_mode:
-            print("🤖 Mock Mode: Simulating robotic arm connection")
+            # Mock commands are synchronous, so skip the worker thread
+            # and queue entirely - _submit runs them inline
+            logger.info("Mock mode: simulating robotic arm connection")
             self.connected = True
-            self._start_command_processor()
             return True
         
         try:
             if self.port is None:
                 self.port = self._auto_detect_port()
                 if self.port is None:
-                    print("❌ No robotic arm port detected")
+                    logger.error("No robotic arm port detected")
                     return False
             
             self.serial_connection = serial.Serial(
@@ -93,26 +165,37 @@ class RoboticArmController:
                 baudrate=self.baudrate,
                 timeout=self.timeout
             )
-            
+
+            # Ask the kernel driver for low-latency mode (ASYNC_LOW_LATENCY
+            # on Linux); FTDI adapters otherwise coalesce short commands for
+            # up to 16 ms before transmitting. Not supported everywhere, so
+            # fall back silently.
+            try:
+                self.serial_connection.set_low_latency_mode(True)
+            except (AttributeError, NotImplementedError, ValueError, OSError):
+                pass
+
             # Test connection
-            time.sleep(2)  # Wait for arm to initialize
             if self._test_connection():
                 self.connected = True
                 self._start_command_processor()
-                print(f"✅ Connected to robotic arm on {self.port}")
+                logger.info("Connected to robotic arm on %s", self.port)
                 return True
             else:
-                print("❌ Failed to establish communication with robotic arm")
+                logger.error("Failed to establish communication with robotic arm")
                 return False
                 
         except Exception as e:
-            print(f"❌ Connection error: {e}")
+            logger.error("Connection error: %s", e)
             return False
     
     def disconnect(self):
         """Disconnect from the robotic arm."""
-        self.running = False
-        
+        self._stop.set()
+        # Sentinel wakes the worker immediately instead of waiting for
+        # its queue timeout to expire
+        self.command_queue.put(None)
+
         if self.command_thread and self.command_thread.is_alive():
             self.command_thread.join(timeout=2.0)
         
@@ -120,121 +203,185 @@ class RoboticArmController:
             self.serial_connection.close()
         
         self.connected = False
-        print("🔌 Disconnected from robotic arm")
+        logger.info("Disconnected from robotic arm")
     
     def _auto_detect_port(self) -> Optional[str]:
         """Auto-detect the robotic arm serial port."""
-        import serial.tools.list_ports
-        
-        # Look for common robotic arm identifiers
-        arm_identifiers = ['USB', 'ACM', 'ttyUSB', 'ttyACM']
-        
-        ports = serial.tools.list_ports.comports()
-        for port in ports:
-            for identifier in arm_identifiers:
-                if identifier in port.device or identifier in port.description:
-                    print(f"🔍 Found potential robotic arm port: {port.device}")
-                    return port.device
-        
+        for port in serial.tools.list_ports.comports():
+            if _ARM_PORT_RE.search(port.device) or _ARM_PORT_RE.search(port.description or ''):
+                logger.info("Found potential robotic arm port: %s", port.device)
+                return port.device
         return None
     
     def _test_connection(self) -> bool:
-        """Test the connection by sending a status request."""
+        """Probe the arm with status requests until it answers.
+
+        Polls for readiness instead of sleeping out a fixed worst case,
+        so a warm arm connects in well under the 2 s ceiling.
+        """
         try:
-            # Send status request command
-            self._send_raw_command("STATUS")
-            time.sleep(0.5)
-            
-            # Check if we get a response
-            if self.serial_connection.in_waiting > 0:
-                response = self.serial_connection.readline().decode().strip()
-                print(f"📡 Arm response: {response}")
-                return True
+            deadline = time.monotonic() + 2.0
+            while time.monotonic() < deadline:
+                self._write_raw(self._CMD_STATUS)
+                time.sleep(0.05)
+                waiting = self.serial_connection.in_waiting
+                if waiting > 0:
+                    # Sized read of what already arrived - readline()
+                    # could stall for the port timeout waiting for a
+                    # newline that never comes
+                    data = self.serial_connection.read(waiting)
+                    logger.info("Arm response: %s",
+                                data.decode(errors='replace').strip())
+                    return True
             return False
-            
+
         except Exception as e:
-            print(f"Connection test failed: {e}")
+            logger.error("Connection test failed: %s", e)
             return False
     
     def _start_command_processor(self):
         """Start the command processing thread."""
-        self.running = True
+        self._stop.clear()
         self.command_thread = threading.Thread(target=self._command_processor, daemon=True)
         self.command_thread.start()
-    
-    def _command_processor(self):
-        """Process commands from the queue."""
-        while self.running:
-            if self.command_queue:
-                with self.command_lock:
-                    if self.command_queue:
-                        command = self.command_queue.pop(0)
-                        self._execute_command(command)
-            time.sleep(0.01)  # 10ms delay
-    
-    def _execute_command(self, command: Dict[str, Any]):
-        """Execute a single command."""
+
+    @staticmethod
+    def _try_raise_priority():
+        """Request real-time scheduling for the calling thread.
+
+        SCHED_FIFO keeps command-dispatch latency bounded when the EMG
+        sampler and GUI threads are busy. Needs CAP_SYS_NICE; falls back
+        silently to normal priority. Only the serial worker asks for
+        real-time priority - the other threads stay SCHED_OTHER so they
+        are not starved.
+        """
         try:
-            command_type = command.get('type')
-            
-            if command_type == 'grab':
-                self._grab_object()
-            elif command_type == 'release':
-                self._release_object()
-            elif command_type == 'move':
-                self._move_joint(command.get('joint'), command.get('angle'))
-            elif command_type == 'home':
-                self._home_position()
-            elif command_type == 'status':
-                self._get_status()
-            
-            self.commands_sent += 1
-            self.last_command_time = time.time()
-            
-        except Exception as e:
-            print(f"❌ Command execution failed: {e}")
-            self.commands_failed += 1
-    
-    def _send_raw_command(self, command: str):
-        """Send a raw command to the robotic arm."""
-        if self.mock_mode:
-            print(f"📤 Mock Command: {command}")
-            return
-        
+            os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(20))
+        except (AttributeError, PermissionError, OSError):
+            pass
+
+    def _command_processor(self):
+        """Process commands from the queue, coalescing serial writes."""
+        self._try_raise_priority()
+        while not self._stop.is_set():
+            try:
+                command = self.command_queue.get(timeout=0.1)
+            except queue.Empty:
+                continue
+            if command is None:  # shutdown sentinel from disconnect()
+                break
+            # Drain whatever else is already queued so a burst of
+            # commands costs one serial write instead of one per command
+            batch = [command]
+            while len(batch) < 32:
+                try:
+                    command = self.command_queue.get_nowait()
+                except queue.Empty:
+                    break
+                if command is None:
+                    self._stop.set()
+                    break
+                batch.append(command)
+            self._execute_batch(batch)
+
+    def _execute_batch(self, batch):
+        """Execute a batch of commands with one coalesced serial write."""
+        pending = []
+        # One clock read covers the whole batch - the commands flush in
+        # the same serial write anyway
+        now = time.time()
+        for command in batch:
+            try:
+                command['timestamp'] = now
+                raw = self._execute_command(command)
+                if raw is not None:
+                    pending.append(raw)
+                self.commands_sent += 1
+                self.last_command_time = now
+            except Exception as e:
+                logger.error("Command execution failed: %s", e)
+                self.commands_failed += 1
+        self._pose_dirty = True
+        if pending:
+            # Syscall and USB transaction overhead is per write, not per
+            # byte, at these command sizes
+            self._write_raw(b"".join(pending))
+
+    def _execute_command(self, command: Dict[str, Any]) -> Optional[bytes]:
+        """Execute a single command, returning any serial payload to send."""
+        command_type = command.get('type')
+
+        if command_type == 'grab':
+            return self._grab_object()
+        elif command_type == 'release':
+            return self._release_object()
+        elif command_type == 'move':
+            joint = command.get('joint')
+            with self._pending_lock:
+                if self._pending_moves.get(joint) is command:
+                    del self._pending_moves[joint]
+                # Read the angle inside the lock so a last-moment
+                # retarget from move_joint is not lost
+                angle = command.get('angle')
+            return self._move_joint(joint, angle)
+        elif command_type == 'home':
+            return self._home_position()
+        elif command_type == 'status':
+            return self._get_status()
+        return None
+
+    def _write_raw(self, payload: bytes):
+        """Write pre-encoded command bytes to the serial link."""
         if self.serial_connection and self.serial_connection.is_open:
-            self.serial_connection.write(f"{command}\n".encode())
-    
+            self.serial_connection.write(payload)
+
+    def _submit(self, command: Dict[str, Any]):
+        """Hand a command to the worker, or run it inline when mocking."""
+        if self.mock_mode:
+            self._execute_batch([command])
+        else:
+            self.command_queue.put(command)
+
+    def _gripper_debounced(self, action: str) -> bool:
+        """Return True if this gripper action repeats within the debounce window.
+
+        Only identical repeats are dropped; a grab followed by a release
+        (or vice versa) always goes through.
+        """
+        now = time.monotonic()
+        last_action, last_time = self._last_gripper_cmd
+        if action == last_action and now - last_time < self._gripper_debounce:
+            return True
+        self._last_gripper_cmd = (action, now)
+        return False
+
     def grab_object(self):
         """Grab an object with the robotic arm."""
-        command = {'type': 'grab', 'timestamp': time.time()}
-        with self.command_lock:
-            self.command_queue.append(command)
-    
+        if self._gripper_debounced('grab'):
+            return
+        self._submit({'type': 'grab', 'timestamp': None})
+
     def release_object(self):
         """Release an object from the robotic arm."""
-        command = {'type': 'release', 'timestamp': time.time()}
-        with self.command_lock:
-            self.command_queue.append(command)
+        if self._gripper_debounced('release'):
+            return
+        self._submit({'type': 'release', 'timestamp': None})
     
-    def _grab_object(self):
+    def _grab_object(self) -> Optional[bytes]:
         """Internal method to execute grab command."""
+        self.pose.gripper = 1
         if self.mock_mode:
-            print("🤖 Mock: GRABBING object")
-            self.current_position['gripper'] = 1
-        else:
-            # Send grab command to actual arm
-            self._send_raw_command("GRAB")
-            self.current_position['gripper'] = 1
-    
-    def _release_object(self):
+            logger.debug("Mock: grabbing object")
+            return None
+        return self._CMD_GRAB
+
+    def _release_object(self) -> Optional[bytes]:
         """Internal method to execute release command."""
+        self.pose.gripper = 0
         if self.mock_mode:
-            print("🤖 Mock: RELEASING object")
-            self.current_position['gripper'] = 0
-        else:
-            # Send release command to actual arm
-            self._send_raw_command("RELEASE")
-            self.current_position['gripper'] = 0
+            logger.debug("Mock: releasing object")
+            return None
+        return self._CMD_RELEASE
     
     def move_joint(self, joint: str, angle: int):
         """
@@ -244,98 +391,110 @@ class RoboticArmController:
             joint: Joint name ('base', 'shoulder', 'elbow', 'wrist')
             angle: Target angle (0-180)
         """
-        if joint not in self.current_position:
-            print(f"❌ Invalid joint: {joint}")
+        if joint not in self._JOINT_SET:
+            logger.error("Invalid joint: %s", joint)
             return
-        
-        if not 0 <= angle <= 180:
-            print(f"❌ Invalid angle: {angle} (must be 0-180)")
+
+        if angle not in self._ANGLE_RANGE:
+            logger.error("Invalid angle: %s (must be 0-180)", angle)
             return
-        
+
         command = {
             'type': 'move',
             'joint': joint,
             'angle': angle,
-            'timestamp': time.time()
+            'timestamp': None
         }
-        
-        with self.command_lock:
-            self.command_queue.append(command)
+        if not self.mock_mode:
+            with self._pending_lock:
+                pending = self._pending_moves.get(joint)
+                if pending is not None:
+                    # A move for this joint is still queued - retarget it
+                    # in place instead of enqueueing a stale setpoint
+                    pending['angle'] = angle
+                    return
+                self._pending_moves[joint] = command
+        self._submit(command)
     
-    def _move_joint(self, joint: str, angle: int):
+    def _move_joint(self, joint: str, angle: int) -> Optional[bytes]:
         """Internal method to execute joint movement."""
+        setattr(self.pose, joint, angle)
         if self.mock_mode:
-            print(f"🤖 Mock: Moving {joint} to {angle}°")
-            self.current_position[joint] = angle
-        else:
-            # Send movement command to actual arm
-            command = f"MOVE_{joint.upper()}_{angle}"
-            self._send_raw_command(command)
-            self.current_position[joint] = angle
+            logger.debug("Mock: moving %s to %d degrees", joint, angle)
+            return None
+        return self._MOVE_PREFIX[joint] + self._ANGLE_BYTES[angle]
     
     def home_position(self):
         """Move the arm to home position."""
-        command = {'type': 'home', 'timestamp': time.time()}
-        with self.command_lock:
-            self.command_queue.append(command)
+        self._submit({'type': 'home', 'timestamp': None})
     
-    def _home_position(self):
+    def _home_position(self) -> Optional[bytes]:
         """Internal method to execute home position command."""
+        self.pose.reset()
         if self.mock_mode:
-            print("🤖 Mock: Moving to HOME position")
-            self.current_position = {
-                'base': 90, 'shoulder': 90, 'elbow': 90, 
-                'wrist': 90, 'gripper': 0
-            }
-        else:
-            self._send_raw_command("HOME")
-            self.current_position = {
-                'base': 90, 'shoulder': 90, 'elbow': 90, 
-                'wrist': 90, 'gripper': 0
-            }
+            logger.debug("Mock: moving to home position")
+            return None
+        return self._CMD_HOME
     
     def get_status(self) -> Dict[str, Any]:
-        """Get current arm status and position."""
-        return {
-            'connected': self.connected,
-            'position': self.current_position.copy(),
-            'commands_sent': self.commands_sent,
-            'commands_failed': self.commands_failed,
-            'queue_size': len(self.command_queue),
-            'last_command_time': self.last_command_time
-        }
+        """Get current arm status and position.
+
+        The returned mapping (including its position entry) is reused
+        between calls - callers must treat it as read-only.
+        """
+        if self._pose_dirty:
+            for name in self._JOINT_NAMES:
+                self._position_cache[name] = getattr(self.pose, name)
+            self._pose_dirty = False
+        payload = self._status_payload
+        payload['connected'] = self.connected
+        payload['commands_sent'] = self.commands_sent
+        payload['commands_failed'] = self.commands_failed
+        payload['queue_size'] = self.command_queue.qsize()
+        payload['last_command_time'] = self.last_command_time
+        return payload
     
-    def _get_status(self):
+    def _get_status(self) -> Optional[bytes]:
         """Internal method to get status from the arm."""
-        if not self.mock_mode:
-            self._send_raw_command("STATUS")
+        if self.mock_mode:
+            return None
+        return self._CMD_STATUS
     
     def emergency_stop(self):
         """Emergency stop - immediately halt all movement."""
-        print("🚨 EMERGENCY STOP ACTIVATED")
+        logger.warning("EMERGENCY STOP ACTIVATED")
         
-        # Clear command queue
-        with self.command_lock:
-            self.command_queue.clear()
+        # Drain the command queue
+        while True:
+            try:
+                self.command_queue.get_nowait()
+            except queue.Empty:
+                break
+        with self._pending_lock:
+            self._pending_moves.clear()
         
         # Send emergency stop command
         if self.mock_mode:
-            print("🤖 Mock: EMERGENCY STOP")
+            logger.debug("Mock: emergency stop")
         else:
-            self._send_raw_command("EMERGENCY_STOP")
+            self._write_raw(self._CMD_EMERGENCY_STOP)
     
     def set_safety_mode(self, enabled: bool):
         """Enable or disable safety mode."""
         self.safety_enabled = enabled
-        print(f"🛡️ Safety mode: {'ENABLED' if enabled else 'DISABLED'}")
+        logger.info("Safety mode: %s", 'ENABLED' if enabled else 'DISABLED')
     
     def is_connected(self) -> bool:
         """Check if the arm is connected."""
         return self.connected
     
     def get_queue_size(self) -> int:
-        """Get the number of commands in the queue."""
-        return len(self.command_queue)
+        """Get the number of commands in the queue.
+
+        qsize() is approximate while the worker is draining, which is
+        fine for status display.
+        """
+        return self.command_queue.qsize()
 
 
 def test_robotic_arm_controller():
@@ -344,32 +503,41 @@ def test_robotic_arm_controller():
     
     # Create controller in mock mode
     arm = RoboticArmController(mock_mode=True)
-    
+
+    # Mock commands run inline, so only real hardware needs settle time
+    wait = 0 if arm.mock_mode else 1
+
     # Test connection
     if arm.connect():
         print("✅ Connection successful")
-        
+
         # Test basic commands
         print("\n--- Testing Basic Commands ---")
         arm.grab_object()
-        time.sleep(1)
-        
+        if wait:
+            time.sleep(wait)
+
         arm.release_object()
-        time.sleep(1)
-        
+        if wait:
+            time.sleep(wait)
+
         arm.home_position()
-        time.sleep(1)
-        
+        if wait:
+            time.sleep(wait)
+
         # Test joint movements
         print("\n--- Testing Joint Movements ---")
         arm.move_joint('base', 45)
-        time.sleep(1)
-        
+        if wait:
+            time.sleep(wait)
+
         arm.move_joint('shoulder', 135)
-        time.sleep(1)
-        
+        if wait:
+            time.sleep(wait)
+
         arm.move_joint('elbow', 60)
-        time.sleep(1)
+        if wait:
+            time.sleep(wait)
         
         # Test status
         print("\n--- Current Status ---")
@@ -31,18 +31,17 @@ def test_gesture_detector():
         
         print("✅ Gesture detector created successfully")
         
-        # Simulate EMG data
+        # Simulate EMG data: three fist close/open cycles, drawn in bulk
+        # instead of one np.random call per sample
         print("📊 Simulating EMG data...")
-        for i in range(1000):
-            # Simulate fist close/open cycles
-            if 100 <= i <= 200 or 400 <= i <= 500 or 700 <= i <= 800:
-                # Fist close: high amplitude
-                sample = np.random.normal(500, 100)
-            else:
-                # Fist open: low amplitude
-                sample = np.random.normal(50, 20)
-            
-            detector.add_sample(sample)
+        rng = np.random.default_rng(0)  # Seeded for reproducible runs
+        samples = rng.normal(50, 20, 1000)  # Fist open: low amplitude
+        fist_closed = np.zeros(1000, dtype=bool)
+        for start, end in ((100, 200), (400, 500), (700, 800)):
+            fist_closed[start:end + 1] = True
+        # Fist close: high amplitude
+        samples[fist_closed] = rng.normal(500, 100, int(fist_closed.sum()))
+        detector.add_samples(samples)
         
         # Print results
         stats = detector.get_statistics()
@@ -72,19 +71,26 @@ def test_robotic_arm_controller():
         
         print("✅ Robotic arm controller created successfully")
         
+        # Mock commands execute synchronously, so there is nothing to
+        # wait for between them; only real hardware needs settle time
+        wait = 0 if arm.mock_mode else 0.5
+
         # Test connection
         if arm.connect():
             print("✅ Connection successful")
-            
+
             # Test commands
             arm.grab_object()
-            time.sleep(0.5)
-            
+            if wait:
+                time.sleep(wait)
+
             arm.release_object()
-            time.sleep(0.5)
-            
+            if wait:
+                time.sleep(wait)
+
             arm.move_joint('base', 45)
-            time.sleep(0.5)
+            if wait:
+                time.sleep(wait)
             
             # Test status
             status = arm.get_status()
@@ -143,24 +149,24 @@ def test_integration():
         
         # Simulate complete workflow
         print("🎮 Simulating complete EMG control workflow...")
+        rng = np.random.default_rng(0)  # Seeded for reproducible runs
         
         # Simulate 3 fist close/open cycles
         for cycle in range(3):
             print(f"\n--- Cycle {cycle + 1} ---")
             
-            # Fist close phase
-            for i in range(100):
-                sample = np.random.normal(500, 100)  # High amplitude
-                detector.add_sample(sample)
-                time.sleep(0.001)
-            
+            # Fist close phase: one batched ingest instead of 100
+            # sample-plus-sleep iterations
+            detector.add_samples(rng.normal(500, 100, 100))  # High amplitude
+
+            # Gesture validation is wall-clock based: the close phase must
+            # last at least min_gesture_duration before the fist opens
+            time.sleep(0.15)
+
             # Fist open phase
-            for i in range(100):
-                sample = np.random.normal(50, 20)  # Low amplitude
-                detector.add_sample(sample)
-                time.sleep(0.001)
-            
-            time.sleep(0.5)  # Pause between cycles
+            detector.add_samples(rng.normal(50, 20, 100))  # Low amplitude
+
+            time.sleep(0.5)  # Gesture cooldown between cycles
         
         # Check final state
         stats = detector.get_statistics()